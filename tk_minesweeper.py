@@ -3,31 +3,135 @@
 #                            All rights reserved.                             #
 ###############################################################################
 
-from functools import reduce
-from itertools import product, chain
-from operator import add
+from collections import deque
+from functools import lru_cache
 from random import sample
-from tkinter import Button, Frame, Menu, Label, StringVar, Tk, PhotoImage, Toplevel
-from typing import Set, Tuple
+from tkinter import Button, Canvas, Frame, Menu, Label, StringVar, Tk, PhotoImage, Toplevel
+from typing import Optional, Tuple
 
 
 APP_TITLE = "TkMinesweeper"
 
+# Size of a tile image in pixels.
+TILE_SIZE = 24
 
-class Tile(object):
-    """Tile definition object.
+# Emoji images of the reset button.
+EMOJIS = ('happy', 'sad', 'victory')
+
+# Tile images in the order of the sprite sheet.
+SPRITES = ('mine0', 'mine1', 'mine2', 'mine3', 'mine4', 'mine5', 'mine6',
+           'mine7', 'mine8', 'flag', 'mine', 'mine_step', 'mine_ok', 'default')
+
+# Number of tile images displayed per idle callback.
+FLUSH_CHUNK = 64
+
+# Position offsets of the eight adjacent tiles.
+NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1),
+                    (0, -1), (0, 1),
+                    (1, -1), (1, 0), (1, 1))
+
+# Tile state bit flags.
+MINE = 1
+FLAGGED = 2
+REVEALED = 4
+
+
+@lru_cache(maxsize=None)
+def load_image(name: str) -> PhotoImage:
+    """Loads an image from the image folder.
+
+    Every image is loaded only once and shared, Tk master object has to exist.
+    The cache also holds the only strong reference to every image. Tk drops an
+    image as soon as its PhotoImage object is garbage collected, and widgets or
+    canvas items showing it turn blank, so images must outlive them.
+
+    :param name: Image file name without extension.
+    :returns: Loaded image.
     """
 
-    def __init__(self):
+    return PhotoImage(file=f'img/{name}.png')
+
+
+@lru_cache(maxsize=None)
+def load_sprite(name: str) -> PhotoImage:
+    """Loads a tile image from the sprite sheet.
+
+    The sheet is decoded only once, every tile image is copied out of it.
+    Like in load_image, the cache keeps the tile images alive.
+
+    :param name: Tile image name, one of SPRITES.
+    :returns: Loaded image.
+    """
+
+    sheet = load_image('sprites')
+    left = SPRITES.index(name) * TILE_SIZE
+
+    img = PhotoImage(width=TILE_SIZE,
+                     height=TILE_SIZE)
+    img.tk.call(img, 'copy', sheet,
+                '-from', left, 0, left + TILE_SIZE, TILE_SIZE)
+
+    return img
+
+
+def load_images():
+    """Loads all images of the game.
+
+    Called once right after the Tk master object is created, so every image is
+    decoded up front and views only pick the cached objects, also when the
+    board is rebuilt on a difficulty change.
+    """
+
+    for name in EMOJIS:
+        load_image(name)
+
+    for name in SPRITES:
+        load_sprite(name)
+
+
+def flood_fill(index: int,
+               adj_counts: bytearray,
+               state: bytearray,
+               neighbors: list[Tuple[int, ...]]) -> list[int]:
+    """Gets tiles of a zero region and its border.
+
+    The region is walked breadth first, every tile is visited once and
+    flagged tiles are left out. Only the board data is touched, the caller
+    reveals the returned tiles.
+
+    :param index: Tile index.
+    :param adj_counts: Adjacent mine counts board.
+    :param state: Tile state board.
+    :param neighbors: Adjacent tiles table.
+    :returns: The indexes of tiles to reveal.
+    """
+
+    tiles = []
+    queue = deque([index])
+    seen = {index}
+
+    while queue:
+        index_inner = queue.popleft()
+        tiles.append(index_inner)
 
-        self.mine = False
-        self.flagged = False
-        self.revealed = False
+        # Continue only through tiles without adjacent mines.
+        if adj_counts[index_inner] == 0:
+            for index_adj in neighbors[index_inner]:
+                # Not visited, revealed or flagged.
+                if index_adj not in seen and not state[index_adj] & (REVEALED | FLAGGED):
+                    seen.add(index_adj)
+                    queue.append(index_adj)
+
+    return tiles
 
 
 class Model(object):
     """2D model of the gaming board.
 
+    The tile states are kept in a single flat board, each tile being a byte of
+    MINE, FLAGGED and REVEALED bit flags. Tile at position (x, y) is stored at
+    index x * height + y.
+
     :param width: Width of the gaming board.
     :param height: Height of the gaming board.
     :param: mines: Number of mines.
@@ -42,30 +146,85 @@ class Model(object):
         self.height = height
         self.mines = mines
 
-        # Create grid.
-        self.grid = self.create_grid()
+        # Adjacent tiles of every tile.
+        self.neighbors = self.create_neighbors()
 
-        # Add mines to the grid.
-        self.add_mines()
+        # Create boards and add mines to them.
+        self.reset()
+
+    def create_board(self) -> bytearray:
+        """Creates a zeroed Width X Height board of bytes.
+
+        :returns: Flat board of bytes.
+        """
+
+        return bytearray(self.width * self.height)
+
+    def get_index(self,
+                  x: int,
+                  y: int) -> int:
+        """Gets index of a tile.
+
+        :param x: Column of the tile.
+        :param y: Row of the tile.
+        :returns: Tile index.
+        """
+
+        return x * self.height + y
+
+    def get_adjacent_tiles(self,
+                           index: int) -> list[int]:
+        """Gets adjacent tiles without the tile itself.
+
+        :param index: Tile index.
+        :returns: The indexes of adjacent tiles.
+        """
+
+        x, y = divmod(index, self.height)
+
+        return [self.get_index(x + dx, y + dy) for dx, dy in NEIGHBOR_OFFSETS
+                if 0 <= x + dx < self.width and 0 <= y + dy < self.height]
+
+    def create_neighbors(self) -> list[Tuple[int, ...]]:
+        """Creates a table of adjacent tiles of every tile.
+
+        :returns: Flat list of adjacent tile indexes.
+        """
 
-    def create_grid(self) -> list[list[Tile]]:
-        """Creates a Width X Height grid of Tiles.
+        return [tuple(self.get_adjacent_tiles(index)) for index in range(self.width * self.height)]
 
-        :returns: 2D list of tiles.
+    def reset(self):
+        """Clears the tile state and adjacent mine counts boards and adds new
+        mines.
         """
 
-        # Width and height needs to be switched due to button placement.
-        return [[Tile() for _ in range(self.height)] for _ in range(self.width)]
+        self.state = self.create_board()
+        self.adj_counts = self.create_board()
+        self.add_mines()
 
     def add_mines(self):
-        """Adds mines to the grid.
+        """Adds mines to the board.
         """
 
         # TODO: enhance random placement.
-        for x, y in sample(list(product(range(self.width),
-                                        range(self.height))),
-                           self.mines):
-            self.grid[x][y].mine = True
+        for index in sample(range(self.width * self.height),
+                            self.mines):
+            self.add_mine(index)
+
+    def add_mine(self,
+                 index: int):
+        """Adds a mine to the board.
+
+        Adjacent mine counts are updated right away, so they never have to be
+        recomputed for the whole board.
+
+        :param index: Tile index.
+        """
+
+        self.state[index] |= MINE
+
+        for index_adj in self.neighbors[index]:
+            self.adj_counts[index_adj] += 1
 
 
 class View(Frame):
@@ -102,32 +261,82 @@ class View(Frame):
                                   self.height,
                                   self.mines)
 
-        # Create tile buttons.
-        self.default_img = PhotoImage(file='img/default.png')
-        self.buttons = self.create_buttons()
+        # Create tile canvas.
+        self.default_img = load_sprite('default')
+        self.canvas = Canvas(self.master,
+                             bd=0,
+                             highlightthickness=0)
+        self.items = []
+        self.items_height = 0
+        self.items = self.create_items()
+
+    def create_items(self) -> list[int]:
+        """Creates tile images on the canvas.
 
-    def create_buttons(self) -> list[list[Button]]:
-        """Creates tile buttons.
+        Current tile images inside the board are reused and hidden, only the
+        missing ones are created and the ones outside the board deleted.
 
-        :returns: 2D list of tile buttons.
+        :returns: Flat list of canvas image items, same layout as the boards.
         """
 
-        def create_button(x, y) -> Button:
-            """Creates a single tile button.
+        self.canvas.configure(width=self.width * TILE_SIZE,
+                              height=self.height * TILE_SIZE)
+        self.canvas.grid(row=1,
+                         column=1,
+                         columnspan=self.width)
+
+        # Delete tile images outside the board, hide the rest.
+        current = {}
+        for index, item in enumerate(self.items):
+            x, y = divmod(index, self.items_height)
+            if x < self.width and y < self.height:
+                self.canvas.itemconfigure(item,
+                                          image=self.default_img)
+                current[x, y] = item
+            else:
+                self.canvas.delete(item)
+
+        # Create missing tile images.
+        items = [0] * (self.width * self.height)
+        for x in range(self.width):
+            for y in range(self.height):
+                item = current.get((x, y))
+                if item is None:
+                    item = self.canvas.create_image(x * TILE_SIZE,
+                                                    y * TILE_SIZE,
+                                                    image=self.default_img,
+                                                    anchor='nw')
+                items[x * self.height + y] = item
+
+        # Board height the items are laid out for.
+        self.items_height = self.height
+
+        return items
+
+    def get_index(self,
+                  event) -> int:
+        """Gets index of the clicked tile.
+
+        :param event: Canvas mouse event.
+        :returns: Tile index.
+        """
 
-            :returns: Configured tile button.
-            """
+        x = min(event.x // TILE_SIZE, self.width - 1)
+        y = min(event.y // TILE_SIZE, self.height - 1)
 
-            button = Button(self.master,
-                            image=self.default_img,
-                            bd=0)
-            button.grid(row=x + 1,
-                        column=y + 1)
+        return x * self.height + y
 
-            return button
+    def display_tile(self,
+                     index: int,
+                     img: PhotoImage):
+        """Displays an image on a tile.
 
-        # Width and height needs to be switched due to button placement.
-        return [[create_button(y, x) for y in range(self.height)] for x in range(self.width)]
+        :param index: Tile index.
+        :param img: Tile image.
+        """
+
+        self.canvas.itemconfigure(self.items[index],
+                                  image=img)
 
     def display_lose(self):
         """Displays lose emoji.
@@ -163,10 +372,7 @@ class TopPanel(Frame):
         self.grid()
 
         # Emoji image dictionary.
-        self.img_dict = {
-            0: PhotoImage(file='img/happy.png'),
-            1: PhotoImage(file='img/sad.png'),
-            2: PhotoImage(file='img/victory.png')}
+        self.img_dict = {i: load_image(name) for i, name in enumerate(EMOJIS)}
 
         self.reset_button = Button(master,
                                    image=self.img_dict[0],
@@ -208,38 +414,36 @@ class Controller(object):
         # Tk master object.
         self.root = Tk()
 
+        # Load all images once.
+        load_images()
+
         # Main view.
         self.view = View(self.root,
                          self.width,
                          self.height,
                          self.mines)
 
-        # Tile button image dictionary.
-        self.img_dict = {
-            0: PhotoImage(file='img/mine0.png'),
-            1: PhotoImage(file='img/mine1.png'),
-            2: PhotoImage(file='img/mine2.png'),
-            3: PhotoImage(file='img/mine3.png'),
-            4: PhotoImage(file='img/mine4.png'),
-            5: PhotoImage(file='img/mine5.png'),
-            6: PhotoImage(file='img/mine6.png'),
-            7: PhotoImage(file='img/mine7.png'),
-            8: PhotoImage(file='img/mine8.png'),
-            9: PhotoImage(file='img/flag.png'),
-            10: PhotoImage(file='img/mine.png'),
-            11: PhotoImage(file='img/mine_step.png'),
-            12: PhotoImage(file='img/mine_ok.png'),
-            13: PhotoImage(file='img/default.png')}
+        # Tile image updates waiting for the next idle callback.
+        self.pending_tiles = []
+
+        # Tile image dictionary. (built once, also kept on difficulty change)
+        self.img_dict = {i: load_sprite(name) for i, name in enumerate(SPRITES)}
 
         # First mine step.
         self.first_mine = True
 
-        # Number of revealed tiles. (used for winning condition)
-        self.tiles_revealed = set()
+        # Number of safe tiles left to reveal. (used for winning condition)
+        self.safe_remaining = self.width * self.height - self.mines
         self.tiles_flagged = set()
 
+        # Mine counter value displayed by the top panel. (flags, mines)
+        self.cnt_shown = (0, self.mines)
+
         self.game_state = None
 
+        # About window. (created on first use)
+        self.about_window = None
+
         # Bindings
         self.set_bindings()
 
@@ -249,7 +453,7 @@ class Controller(object):
         filemenu = Menu(menubar,
                         tearoff=0)
         filemenu.add_command(label="Undo (not implemented)",
-                             command=self.donothing)
+                             state='disabled')
         filemenu.add_separator()
         filemenu.add_command(label="New", command=self.reset)
         filemenu.add_separator()
@@ -272,39 +476,40 @@ class Controller(object):
         # Main loop.
         self.root.mainloop()
 
-    def donothing(self):
-        # TODO
-        pass
-
     def set_bindings(self):
-        """Sets tile buttons bindings.
+        """Sets tile canvas and reset button bindings.
+
+        The canvas outlives difficulty changes, so bindings are set only once.
         """
 
-        def set_binding(index: Tuple[int, int]):
-            """Sets tile button bindings.
+        # Left click bind to reveal.
+        self.view.canvas.bind('<Button-1>',
+                              self.on_left_click)
+
+        # Right click bind to flag.
+        self.view.canvas.bind('<Button-3>',
+                              self.on_right_click)
+
+        # Set up reset button.
+        self.view.top_panel.reset_button.configure(command=self.reset)
 
-            :param index: Position tuple.
-            """
+    def on_left_click(self,
+                      event):
+        """Reveals the clicked tile.
 
-            x, y = index
+        :param event: Canvas mouse event.
+        """
 
-            # Right click bind to reveal.
-            self.view.buttons[x][y].bind('<Button-1>',
-                                         lambda event: self.reveal((x, y)))
-            # fnc_helper(self.reveal,
-            #            (x, y)))
+        self.reveal(self.view.get_index(event))
 
-            # Left click bind to flag.
-            self.view.buttons[x][y].bind('<Button-3>',
-                                         lambda event: self.flag((x, y)))
+    def on_right_click(self,
+                       event):
+        """Flags the clicked tile.
 
-        list(map(set_binding,
-                 product(range(self.width),
-                         range(self.height))))
+        :param event: Canvas mouse event.
+        """
 
-        # Set up reset button.
-        self.view.top_panel.reset_button.bind('<Button>',
-                                              lambda event: self.reset())
+        self.flag(self.view.get_index(event))
 
     def reset(self):
         """Resets the game.
@@ -312,187 +517,158 @@ class Controller(object):
 
         self.first_mine = True
         self.game_state = None
-        self.tiles_revealed = set()
+        self.safe_remaining = self.width * self.height - self.mines
         self.tiles_flagged = set()
 
-        def reset_tile(index: Tuple[int, int]):
-            """Resets a tile.
-
-            :param index: Position tuple.
-            """
-
-            x, y = index
-
-            self.view.buttons[x][y].configure(image=self.img_dict[13])
-            self.model.grid[x][y].mine = False
-            self.model.grid[x][y].flagged = False
-            self.model.grid[x][y].revealed = False
+        # Hide only tiles that were revealed or flagged.
+        display_tile = self.display_tile
+        default_img = self.img_dict[13]
+        for index, tile in enumerate(self.model.state):
+            if tile & (REVEALED | FLAGGED):
+                display_tile(index, default_img)
 
-        list(map(reset_tile,
-                 product(range(self.width),
-                         range(self.height))))
-
-        self.model.add_mines()
+        self.model.reset()
         self.update_cnt()
 
         self.view.top_panel.reset_button.configure(
             image=self.view.top_panel.img_dict[0])
 
+        # Display hidden tiles straight away.
+        self.root.update_idletasks()
+
     def reveal(self,
-               index: Tuple[int, int]):
+               index: int):
         """Reveals a tile.
 
-        :param index: Position tuple.
+        :param index: Tile index.
         """
 
-        x, y = index
-
-        # Not revealed or flagged.
-        if not self.model.grid[x][y].revealed and not self.model.grid[x][y].flagged:
-            # It is a mine
-            if self.model.grid[x][y].mine and self.game_state != 'win':
-                self.reveal_tile(index)
-                self.game_state = 'Loss'
-                self.lose()
-
-            # Get number of adjacent mines.
-            val = self.get_adjacent_mines_cnt(index)
-            # It has adjacent mines.
-            if val in range(1, 9):
-                self.reveal_tile(index)
-            # Recursive reveal.
-            elif val == 0:
-                self.reveal_rec(index)
+        tile = self.model.state[index]
 
-    def get_adjacent_tiles(self,
-                           index: Tuple[int, int],
-                           width: int,
-                           height: int) -> Set[Tuple[int, int]]:
-        """Gets adjacent tiles.
+        # Revealed or flagged.
+        if tile & (REVEALED | FLAGGED):
+            return
 
-        :param width: Width of the gaming board.
-        :param height: Height of the gaming board.
-        :returns: The indexes of adjacent tiles.
-        """
+        # It is a mine
+        if tile & MINE and self.game_state != 'win':
+            self.reveal_tile(index)
+            self.game_state = 'Loss'
+            self.lose()
 
-        x, y = index
+            # Whole board is revealed already.
+            return
 
-        indexes = set()
+        count = self.model.adj_counts[index]
 
-        def add_index(index_inner: Tuple[int, int]):
-            """Adds a valid index to the set of indexes.
+        # It has adjacent mines.
+        if count:
+            self.reveal_tile(index, count)
+        # Recursive reveal.
+        else:
+            self.reveal_rec(index)
 
-            :param index: Position tuple.
-            """
+    def display_tile(self,
+                     index: int,
+                     img: PhotoImage):
+        """Queues an image to be displayed on a tile.
 
-            x_new, y_new = index_inner
+        Queued images are displayed together once Tk becomes idle.
 
-            # Is valid.
-            if 0 <= x_new <= width - 1 and 0 <= y_new <= height - 1:
-                indexes.add((x_new, y_new))
+        :param index: Tile index.
+        :param img: Tile image.
+        """
 
-        list(map(add_index,
-                 product(range(x + 1, x - 2, -1),
-                         range(y + 1, y - 2, -1))))
+        if not self.pending_tiles:
+            self.root.after_idle(self.flush_tiles)
 
-        return indexes
+        self.pending_tiles.append((index, img))
 
-    def get_adjacent_mines_cnt(self,
-                               index: Tuple[int, int]) -> int:
-        """Gets number of adjacent mines.
+    def flush_tiles(self):
+        """Displays queued tile images.
 
-        :param index: Position tuple.
-        :returns: The number of adjacent mines.
+        Large batches are displayed in chunks, so Tk can repaint the board and
+        handle events in between.
         """
 
-        def is_mine(index) -> bool:
-            """Determines if the tile is a mine.
+        chunk = self.pending_tiles[:FLUSH_CHUNK]
+        del self.pending_tiles[:FLUSH_CHUNK]
 
-            :param index: Position tuple.
-            :returns: Whether the tile is a mine.
-            """
+        display_tile = self.view.display_tile
+        for index, img in chunk:
+            display_tile(index, img)
 
-            return self.model.grid[index[0]][index[1]].mine
-
-        return reduce(add,
-                      map(is_mine,
-                          self.get_adjacent_tiles(index,
-                                                  self.width,
-                                                  self.height)))
+        if self.pending_tiles:
+            self.root.after(1, self.flush_tiles)
 
     def reveal_tile(self,
-                    index: Tuple[int, int]):
+                    index: int,
+                    count: Optional[int] = None):
         """Reveals a tile.
 
-        :param index: Position tuple.
+        :param index: Tile index.
+        :param count: Number of adjacent mines, if already known by the caller.
         """
 
-        x, y = index
-
-        # Not revealed.
-        if not self.model.grid[x][y].revealed:
-            cells_unrevealed = self.width * \
-                self.height - len(self.tiles_revealed) - 1
-
-            # Already flagged tile and end of the game.
-            if self.model.grid[x][y].flagged and self.game_state:
-                # Mine guess was ok.
-                if self.model.grid[x][y].mine:
-                    self.view.buttons[x][y].configure(
-                        image=self.img_dict[12])
-                # Mine guess was wrong.
-                else:
-                    self.model.grid[x][y].flagged = False
-                    self.tiles_flagged.remove(index)
-                    self.update_cnt()
-                    self.reveal_tile(index)
-
-            # Mine.
-            elif self.model.grid[x][y].mine:
-                if not self.first_mine:
-                    self.view.buttons[x][y].configure(image=self.img_dict[10])
-                else:
-                    self.view.buttons[x][y].configure(image=self.img_dict[11])
-                    self.first_mine = False
-
-                self.model.grid[x][y].revealed = True
-
-            # Normal tile.
+        state = self.model.state
+        tile = state[index]
+
+        # Revealed.
+        if tile & REVEALED:
+            return
+
+        # Already flagged tile and end of the game.
+        if tile & FLAGGED and self.game_state:
+            # Mine guess was ok.
+            if tile & MINE:
+                self.display_tile(index, self.img_dict[12])
+            # Mine guess was wrong.
             else:
-                # Checks if cell is in the board limits
-                value = self.get_adjacent_mines_cnt(index)
+                state[index] &= ~FLAGGED
+                self.tiles_flagged.remove(index)
+                self.update_cnt()
+                self.reveal_tile(index)
 
-                self.view.buttons[x][y].configure(image=self.img_dict[value])
-                self.tiles_revealed.add(index)
-                self.model.grid[x][y].revealed = True
+        # Mine.
+        elif tile & MINE:
+            if not self.first_mine:
+                self.display_tile(index, self.img_dict[10])
+            else:
+                self.display_tile(index, self.img_dict[11])
+                self.first_mine = False
 
-                # Removes cell from flagged list when the cell gets revealed
-                if index in self.tiles_flagged:
-                    self.tiles_flagged.remove(index)
-                    self.update_cnt()
+            state[index] |= REVEALED
 
-                # Check for win condition
-                if cells_unrevealed == self.mines and not self.game_state:
-                    self.win()
+        # Normal tile.
+        else:
+            # Get number of adjacent mines.
+            if count is None:
+                count = self.model.adj_counts[index]
+
+            self.display_tile(index, self.img_dict[count])
+            self.safe_remaining -= 1
+            state[index] |= REVEALED
+
+            # Check for win condition
+            if self.safe_remaining == 0 and not self.game_state:
+                self.win()
 
     def reveal_rec(self,
-                   index: Tuple[int, int]):
-        """Reveals tiles recursively.
+                   index: int):
+        """Reveals tiles of a zero region and its border.
 
-        :param index: Position tuple.
+        :param index: Tile index.
         """
 
-        val = self.get_adjacent_mines_cnt(index)
-        for index_inner in self.get_adjacent_tiles(index,
-                                                   self.width,
-                                                   self.height) | {index}:
-            # Not revealed.
-            if not self.model.grid[index_inner[0]][index_inner[1]].revealed:
-                self.reveal_tile(index_inner)
-                val = self.get_adjacent_mines_cnt(index_inner)
-                # Continue recursion
-                if val == 0:
-                    self.reveal_rec(index_inner)
+        adj_counts = self.model.adj_counts
+        reveal_tile = self.reveal_tile
+        for index_inner in flood_fill(index,
+                                      adj_counts,
+                                      self.model.state,
+                                      self.model.neighbors):
+            reveal_tile(index_inner, adj_counts[index_inner])
+
+        # Display revealed tiles straight away.
+        self.root.update_idletasks()
 
     def win(self):
         """Displays win.
@@ -505,44 +681,57 @@ class Controller(object):
         """Reveals all tiles and displays lose.
         """
 
-        list(map(self.reveal_tile,
-                 product(range(self.width),
-                         range(self.height))))
+        # Tiles not revealed yet, in a single pass over the board.
+        hidden = [index for index, tile in enumerate(self.model.state)
+                  if not tile & REVEALED]
+
+        reveal_tile = self.reveal_tile
+        for index in hidden:
+            reveal_tile(index)
 
         self.view.display_lose()
 
+        # Display revealed tiles straight away.
+        self.root.update_idletasks()
+
     def flag(self,
-             index: Tuple[int, int]):
+             index: int):
         """Flags tile as a possible mine.
 
-        :param index: Position tuple.
+        :param index: Tile index.
         """
 
-        x, y = index
+        state = self.model.state
+        tile = state[index]
 
-        button = self.view.buttons[x][y]
-
-        # Not revealed.
-        if not self.model.grid[x][y].revealed:
-            # Not flagged and we can still add a flag.
-            if not self.model.grid[x][y].flagged and len(self.tiles_flagged) < self.mines:
-                button.configure(image=self.img_dict[9])
-                self.tiles_flagged.add(index)
-                self.model.grid[x][y].flagged = True
-            # Flagged.
-            elif self.model.grid[x][y].flagged:
-                button.configure(image=self.img_dict[13])
-                self.tiles_flagged.remove(index)
-                self.model.grid[x][y].flagged = False
+        # Revealed.
+        if tile & REVEALED:
+            return
 
+        # Not flagged and we can still add a flag.
+        if not tile & FLAGGED and len(self.tiles_flagged) < self.mines:
+            self.display_tile(index, self.img_dict[9])
+            self.tiles_flagged.add(index)
+            state[index] |= FLAGGED
+            self.update_cnt()
+        # Flagged.
+        elif tile & FLAGGED:
+            self.display_tile(index, self.img_dict[13])
+            self.tiles_flagged.remove(index)
+            state[index] &= ~FLAGGED
             self.update_cnt()
 
     def update_cnt(self):
         """Updates mine counter.
+
+        Tk is only called when the displayed value changes.
         """
 
-        self.view.top_panel.mines_cnt.set(
-            f'{len(self.tiles_flagged)} / {self.mines}')
+        cnt = (len(self.tiles_flagged), self.mines)
+
+        if cnt != self.cnt_shown:
+            self.cnt_shown = cnt
+            self.view.top_panel.mines_cnt.set(f'{cnt[0]} / {cnt[1]}')
 
     def change_diff(self,
                     diff_lvl: int):
@@ -551,7 +740,6 @@ class Controller(object):
         :param diff_lvl: Difficulty level.
         """
 
-        # self.reset()
         self.width = self.diff_dict[diff_lvl][0]
         self.height = self.diff_dict[diff_lvl][1]
         self.mines = self.diff_dict[diff_lvl][2]
@@ -560,39 +748,48 @@ class Controller(object):
         self.model.width = self.width
         self.model.height = self.height
         self.model.mines = self.mines
-        self.model.grid = self.model.create_grid()
-        self.model.add_mines()
+        self.model.neighbors = self.model.create_neighbors()
+        self.model.reset()
 
         # Update View.
         self.view.width = self.width
         self.view.height = self.height
         self.view.mines = self.mines
-        for button in chain.from_iterable(self.view.buttons):
-            button.destroy()
-        self.view.buttons = self.view.create_buttons()
+        self.pending_tiles = []
+        self.view.items = self.view.create_items()
 
         # Reset
         self.first_mine = True
         self.game_state = None
-        self.tiles_revealed = set()
+        self.safe_remaining = self.width * self.height - self.mines
         self.tiles_flagged = set()
         self.update_cnt()
         self.view.top_panel.reset_button.configure(
             image=self.view.top_panel.img_dict[0])
-        self.set_bindings()
 
     def show_about(self):
-        # about_window = Tk()
-        # about_window = about_window.title("About")
-        # about_text = Label(
-        #     about_window, text='Here are the rules...', foreground="black")
-        # about_text.grid(row=0, column=0, columnspan=3)
-        # about_window.mainloop()
+        """Shows about window.
+
+        The window is created on first use and reused afterwards.
+        """
+
+        # Show the existing window.
+        if self.about_window is not None:
+            self.about_window.deiconify()
+            self.about_window.lift()
+            return
+
         about_window = Toplevel(self.root)
         about_window.geometry("420x140")
         about_window.title("About")
         about_window.resizable(False,
                                False)
+
+        # Only hide the window when closed, so it can be shown again.
+        about_window.protocol('WM_DELETE_WINDOW',
+                              about_window.withdraw)
+        self.about_window = about_window
+
         Label(about_window,
               text="Copyright (C) 2022  Jakub Maly – https://github.com/malyjak\nThis is experimental software; see the source code for copying conditions.\nThere is ABSOLUTELY NO WARRANTY; not even for\nMERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.\nSee the documentation for example usage.").place(x=10, y=20)
 